@@ -7,15 +7,14 @@ import shutil
 import subprocess
 import time
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
-import docker
-import yaml
-from docker.errors import DockerException
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, Horizontal, Vertical
+from textual.coordinate import Coordinate
 from textual.widgets import Button, DataTable, Footer, Header, Label, Static
+from textual.widgets.data_table import CellDoesNotExist
 
 from agentbox_manager import terminal
 from agentbox_manager.models import AgentInstance, InstanceStatus
@@ -25,6 +24,15 @@ from agentbox_manager.screens.help import HelpScreen
 from agentbox_manager.screens.startup import StartupScreen
 from agentbox_manager.screens.terminal_demo import TerminalDemoScreen
 
+if TYPE_CHECKING:
+    import docker
+
+# Rich markup for the status column, styled by the .status-<value> CSS classes
+_STATUS_MARKUP = {
+    status: f"[status-{status.value}]{status.value}[/status-{status.value}]"
+    for status in InstanceStatus
+}
+
 
 class InstanceManagerApp(App):
     """Textual TUI application for managing Agent instances."""
@@ -43,6 +51,30 @@ class InstanceManagerApp(App):
         Binding("q", "quit", "Quit"),
     ]
 
+    # (label, key) pairs for the instances table; keys allow per-cell updates
+    _COLUMNS = (
+        ("Name", "name"),
+        ("Status", "status"),
+        ("CPU", "cpu"),
+        ("Memory", "memory"),
+        ("SSH", "ssh"),
+        ("RDP", "rdp"),
+        ("Priority", "priority"),
+    )
+
+    # Button id -> action method name, dispatched by on_button_pressed
+    _BUTTON_ACTIONS = {
+        "create-btn": "action_create_instance",
+        "attach-btn": "action_attach_instance",
+        "start-btn": "action_start_instance",
+        "stop-btn": "action_stop_instance",
+        "delete-btn": "action_delete_instance",
+        "ssh-btn": "action_connect_ssh",
+        "rdp-btn": "action_connect_rdp",
+        "refresh-btn": "action_refresh",
+        "help-btn": "action_help",
+    }
+
     CSS = """
     #main-container {
         height: 100%;
@@ -88,35 +120,45 @@ class InstanceManagerApp(App):
         super().__init__(*args, **kwargs)
         # Instances registry: name -> AgentInstance
         self.instances: Dict[str, AgentInstance] = {}
+        # Port -> instance name indexes for conflict checks and suggestions
+        self._ssh_ports: Dict[int, str] = {}
+        self._rdp_ports: Dict[int, str] = {}
         # Compose / config paths under the user's home by default
         self.compose_dir: Path = Path.home() / ".agentbox-manager"
         self.compose_path: Path = self.compose_dir / "docker-compose.yml"
         self.compose_project: str = "agentbox"
         self.config_file: Path = self.compose_dir / "config.json"
-        # Try to initialize Docker SDK client but fall back gracefully
-        try:
-            self.docker_client = docker.from_env()
-        except DockerException:
-            self.docker_client = None
-        except Exception:
-            self.docker_client = None
-        # Detect whether docker or docker-compose CLI is available
-        self.docker_cli_available = bool(
-            shutil.which("docker") or shutil.which("docker-compose")
-        )
+        # Compose CLI prefix, detected lazily by _detect_compose_cmd()
+        self._compose_base_cmd: list[str] | None = None
+        # Hash of the last compose spec written by _write_compose()
+        self._last_compose_hash: int | None = None
+        # Single long-lived Docker SDK client shared by the app and its screens.
+        # Connecting costs a daemon round trip, so _probe_docker() does it on
+        # mount instead of blocking construction.
+        self.docker_client: Optional[docker.DockerClient] = None
+        self.docker_cli_available = False
+        # Serialises connects so a Start during the probe waits for it instead
+        # of building a second client
+        self._docker_lock = asyncio.Lock()
 
     def _init_docker_client(self) -> None:
-        """Initialize or reinitialize the Docker SDK client and CLI availability flag.
+        """Initialize the Docker SDK client if needed and refresh CLI availability.
 
         This is called before actions that need Docker to ensure the app has
-        up-to-date knowledge about SDK/CLI availability.
+        up-to-date knowledge about SDK/CLI availability. An existing client is
+        reused rather than reconnecting on every action.
         """
-        try:
-            self.docker_client = docker.from_env()
-        except DockerException:
-            self.docker_client = None
-        except Exception:
-            self.docker_client = None
+        if self.docker_client is None:
+            # Imported lazily: the docker SDK is slow to import
+            import docker
+            from docker.errors import DockerException
+
+            try:
+                self.docker_client = docker.from_env()
+            except DockerException:
+                self.docker_client = None
+            except Exception:
+                self.docker_client = None
 
         # Refresh CLI availability
         self.docker_cli_available = bool(
@@ -156,36 +198,51 @@ class InstanceManagerApp(App):
 
     def on_mount(self) -> None:
         table = self.query_one("#instances-table", DataTable)
-        table.add_columns("Name", "Status", "CPU", "Memory", "SSH", "RDP", "Priority")
+        for label, key in self._COLUMNS:
+            table.add_column(label, key=key)
         # If the demo env var is set, open the embedded terminal demo
         if os.environ.get("AGENTBOX_TERMINAL_DEMO") or os.environ.get(
             "TOADBOX_TERMINAL_DEMO"
         ):
             self.push_screen(TerminalDemoScreen())
             return
+        self.refresh_table()
+        self.query_one("#status-bar", Static).update("Docker connecting...")
+        asyncio.create_task(self._probe_docker())
+
+    async def _probe_docker(self) -> None:
+        """Detect Docker off the event loop, then show the startup dialog."""
+        await self._ensure_docker()
+        # Warm the compose CLI cache so the first start/stop skips the probe
+        await asyncio.to_thread(self._detect_compose_cmd)
+        self._update_status_bar()
         if self.docker_client:
             self.push_screen(StartupScreen(), self._handle_startup_result)
-        else:
-            self.refresh_table()
+
+    async def _ensure_docker(self) -> None:
+        """Run `_init_docker_client` off the loop, one connect at a time."""
+        async with self._docker_lock:
+            await asyncio.to_thread(self._init_docker_client)
+
+    def on_unmount(self) -> None:
+        self._drop_docker_client()
+
+    def _drop_docker_client(self) -> None:
+        """Close and forget the SDK client, releasing its connection pool."""
+        client, self.docker_client = self.docker_client, None
+        if client is not None:
+            try:
+                client.close()
+            except Exception:
+                pass
 
     def action_terminal_demo(self) -> None:
         self.push_screen(TerminalDemoScreen())
 
     def on_button_pressed(self, event: Button.Pressed) -> None:  # type: ignore[override]
-        mapping = {
-            "create-btn": self.action_create_instance,
-            "attach-btn": self.action_attach_instance,
-            "start-btn": self.action_start_instance,
-            "stop-btn": self.action_stop_instance,
-            "delete-btn": self.action_delete_instance,
-            "ssh-btn": self.action_connect_ssh,
-            "rdp-btn": self.action_connect_rdp,
-            "refresh-btn": self.action_refresh,
-            "help-btn": self.action_help,
-        }
-        handler = mapping.get(event.button.id or "")
-        if handler:
-            handler()
+        handler_name = self._BUTTON_ACTIONS.get(event.button.id or "")
+        if handler_name:
+            getattr(self, handler_name)()
 
     def _handle_startup_result(self, result: Optional[tuple[str, str]]) -> None:
         if not result:
@@ -206,36 +263,70 @@ class InstanceManagerApp(App):
             with open(self.config_file, "r", encoding="utf-8") as handle:
                 data = json.load(handle)
             self.instances = {
-                name: AgentInstance.from_dict(payload)
+                name: AgentInstance.from_dict(payload, copy=False)
                 for name, payload in data.get("instances", {}).items()
             }
         except (OSError, json.JSONDecodeError):
             self.instances = {}
+        self._index_ports()
+
+    def _index_ports(self) -> None:
+        """Rebuild the port -> instance name indexes from `self.instances`."""
+        self._ssh_ports = {inst.ssh_port: name for name, inst in self.instances.items()}
+        self._rdp_ports = {inst.rdp_port: name for name, inst in self.instances.items()}
 
     def save_config(self) -> None:
         data = {
             "instances": {name: inst.to_dict() for name, inst in self.instances.items()}
         }
         with open(self.config_file, "w", encoding="utf-8") as handle:
-            json.dump(data, handle, indent=2)
+            # one write() instead of json.dump's per-token writes
+            handle.write(json.dumps(data, indent=2))
         # Keep the unified compose file in sync with saved instances
         self._write_compose()
 
     def refresh_table(self) -> None:
+        """Sync the table with `self.instances`, touching only rows that changed.
+
+        Rows are keyed by instance name, so the cursor and scroll position
+        survive a refresh.
+        """
         table = self.query_one("#instances-table", DataTable)
-        table.clear()
+        existing = {row_key.value for row_key in table.rows}
+        for name in existing - self.instances.keys():
+            table.remove_row(name)
         for inst in self.instances.values():
-            status_style = f"status-{inst.status.value}"
-            table.add_row(
-                inst.name,
-                f"[{status_style}]{inst.status.value}[/{status_style}]",
-                str(inst.cpu_cores),
-                f"{inst.memory_mb}MB",
-                str(inst.ssh_port),
-                str(inst.rdp_port),
-                inst.priority,
-                key=inst.name,
-            )
+            cells = self._row_cells(inst)
+            if inst.name not in existing:
+                table.add_row(*cells, key=inst.name)
+                continue
+            for (_, column_key), value in zip(self._COLUMNS, cells):
+                if table.get_cell(inst.name, column_key) != value:
+                    table.update_cell(inst.name, column_key, value)
+        self._update_status_bar()
+
+    def _row_cells(self, inst: AgentInstance) -> tuple[str, ...]:
+        return (
+            inst.name,
+            _STATUS_MARKUP[inst.status],
+            str(inst.cpu_cores),
+            f"{inst.memory_mb}MB",
+            str(inst.ssh_port),
+            str(inst.rdp_port),
+            inst.priority,
+        )
+
+    def _update_row(self, instance: AgentInstance) -> None:
+        """Update just the status cell of `instance` instead of rebuilding the table."""
+        table = self.query_one("#instances-table", DataTable)
+        try:
+            table.update_cell(instance.name, "status", _STATUS_MARKUP[instance.status])
+        except CellDoesNotExist:
+            self.refresh_table()
+            return
+        self._update_status_bar()
+
+    def _update_status_bar(self) -> None:
         status_bar = self.query_one("#status-bar", Static)
         running = sum(
             1
@@ -246,19 +337,14 @@ class InstanceManagerApp(App):
 
     def get_selected_instance(self) -> Optional[AgentInstance]:
         table = self.query_one("#instances-table", DataTable)
-        if table.cursor_row is None:
+        if table.cursor_row is None or table.row_count == 0:
             return None
+        # Rows are keyed by instance name; read the key instead of the row cells
         try:
-            # DataTable implementations may vary; guard against any lookup errors
-            if table.row_count == 0:
-                return None
-            row = table.get_row_at(table.cursor_row)
-            if not row:
-                return None
-            return self.instances.get(str(row[0]))
-        except (KeyError, IndexError, LookupError, ValueError, AttributeError):
+            cell_key = table.coordinate_to_cell_key(Coordinate(table.cursor_row, 0))
+        except CellDoesNotExist:
             return None
-        return None
+        return self.instances.get(cell_key.row_key.value)
 
     def action_create_instance(self) -> None:
         self.push_screen(FolderPickerScreen(), self._handle_folder_selected)
@@ -269,20 +355,24 @@ class InstanceManagerApp(App):
         self.push_screen(CreateInstanceScreen(selected))
 
     def create_instance(self, instance: AgentInstance) -> None:
-        for existing_name, existing in self.instances.items():
+        ssh_owner = self._ssh_ports.get(instance.ssh_port)
+        rdp_owner = self._rdp_ports.get(instance.rdp_port)
+        existing_name = ssh_owner or rdp_owner
+        if existing_name:
             conflicts = []
-            if existing.ssh_port == instance.ssh_port:
+            if ssh_owner == existing_name:
                 conflicts.append("SSH")
-            if existing.rdp_port == instance.rdp_port:
+            if rdp_owner == existing_name:
                 conflicts.append("RDP")
-            if conflicts:
-                ports = ", ".join(conflicts)
-                self.show_error(f"Ports already in use by '{existing_name}' ({ports})")
-                return
+            ports = ", ".join(conflicts)
+            self.show_error(f"Ports already in use by '{existing_name}' ({ports})")
+            return
         if instance.name in self.instances:
             self.show_error(f"Instance '{instance.name}' already exists")
             return
         self.instances[instance.name] = instance
+        self._ssh_ports[instance.ssh_port] = instance.name
+        self._rdp_ports[instance.rdp_port] = instance.name
         self.save_config()
         self.refresh_table()
 
@@ -290,43 +380,44 @@ class InstanceManagerApp(App):
         self, ssh_start: int = 2222, rdp_start: int = 3390
     ) -> tuple[int, int]:
         """Return the next available (ssh_port, rdp_port) not used by existing instances."""
-        used_ssh = {inst.ssh_port for inst in self.instances.values()}
-        used_rdp = {inst.rdp_port for inst in self.instances.values()}
-
         ssh_port = ssh_start
-        while ssh_port in used_ssh:
+        while ssh_port in self._ssh_ports:
             ssh_port += 1
 
         rdp_port = rdp_start
-        while rdp_port in used_rdp:
+        while rdp_port in self._rdp_ports:
             rdp_port += 1
 
         return ssh_port, rdp_port
 
     def action_start_instance(self) -> None:
-        # Reinitialize docker client in case Docker became available after app start
-        self._init_docker_client()
         inst = self.get_selected_instance()
         if not inst:
             self.show_error("No instance selected")
             return
-        if not self.docker_client and not getattr(self, "docker_cli_available", False):
-            self.show_error("Docker is not available. Start Docker and retry.")
-            return
         asyncio.create_task(self._start_async(inst))
 
     async def _start_async(self, instance: AgentInstance) -> None:
+        # Reinitialize docker client in case Docker became available after app
+        # start; while the startup probe is still connecting this waits for it
+        await self._ensure_docker()
+        if not self.docker_client and not getattr(self, "docker_cli_available", False):
+            self.show_error("Docker is not available. Start Docker and retry.")
+            return
         instance.status = InstanceStatus.STARTING
-        self.refresh_table()
-        ok, detail = self._run_compose(instance, "up")
+        self._update_row(instance)
+        # compose shells out and can take seconds; keep it off the event loop
+        ok, detail = await self._run_compose_async(instance, "up")
         if ok:
-            instance.status = self._get_compose_status(instance)
+            instance.status = await asyncio.to_thread(
+                self._get_compose_status, instance
+            )
             self.save_config()
         else:
             instance.status = InstanceStatus.ERROR
             message = f"Failed to start: {detail or 'no output'}"
             self.show_error(message)
-        self.refresh_table()
+        self._update_row(instance)
 
     def action_stop_instance(self) -> None:
         inst = self.get_selected_instance()
@@ -336,15 +427,15 @@ class InstanceManagerApp(App):
 
     async def _stop_async(self, instance: AgentInstance) -> None:
         instance.status = InstanceStatus.STOPPING
-        self.refresh_table()
-        ok, detail = self._run_compose(instance, "stop")
+        self._update_row(instance)
+        ok, detail = await self._run_compose_async(instance, "stop")
         if ok:
             instance.status = InstanceStatus.STOPPED
             self.save_config()
         else:
             instance.status = InstanceStatus.ERROR
             self.show_error(f"Failed to stop: {detail}")
-        self.refresh_table()
+        self._update_row(instance)
 
     def action_delete_instance(self) -> None:
         inst = self.get_selected_instance()
@@ -355,9 +446,15 @@ class InstanceManagerApp(App):
     async def _delete_async(self, instance: AgentInstance) -> None:
         if instance.status == InstanceStatus.RUNNING:
             await self._stop_async(instance)
-        ok, detail = self._run_compose(instance, "rm", include_volumes=True)
+        ok, detail = await self._run_compose_async(
+            instance, "rm", include_volumes=True
+        )
         if ok:
             self.instances.pop(instance.name, None)
+            if self._ssh_ports.get(instance.ssh_port) == instance.name:
+                del self._ssh_ports[instance.ssh_port]
+            if self._rdp_ports.get(instance.rdp_port) == instance.name:
+                del self._rdp_ports[instance.rdp_port]
             self.save_config()
         else:
             self.show_error(f"Failed to delete: {detail}")
@@ -416,101 +513,138 @@ class InstanceManagerApp(App):
 
     def _write_compose(self) -> Path:
         """Write a single docker-compose file containing all instances."""
-        self.compose_dir.mkdir(exist_ok=True)
         compose_dict = self._build_compose_spec()
+        # Skip serialising and rewriting an unchanged spec
+        spec_hash = hash(json.dumps(compose_dict, sort_keys=True))
+        if spec_hash == self._last_compose_hash and self.compose_path.exists():
+            return self.compose_path
+        self.compose_dir.mkdir(exist_ok=True)
+        import yaml
+
+        # LibYAML's C emitter when available (PyYAML only exports it then)
+        dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
         self.compose_path.write_text(
-            yaml.dump(compose_dict, default_flow_style=False), encoding="utf-8"
+            yaml.dump(compose_dict, Dumper=dumper, default_flow_style=False),
+            encoding="utf-8",
         )
+        self._last_compose_hash = spec_hash
         return self.compose_path
 
+    def _detect_compose_cmd(self) -> list[str] | None:
+        """Return the compose CLI prefix, probing for it only once.
+
+        Prefers the `docker compose` plugin and falls back to the standalone
+        `docker-compose` binary. A missing CLI is not cached so that it is
+        picked up once installed.
+        """
+        if self._compose_base_cmd is not None:
+            return self._compose_base_cmd
+        docker_bin = shutil.which("docker")
+        docker_compose_bin = shutil.which("docker-compose")
+        if docker_bin:
+            try:
+                probe = subprocess.run(
+                    [docker_bin, "compose", "version"],
+                    capture_output=True,
+                    text=True,
+                    timeout=5,
+                    check=False,
+                )
+            except subprocess.TimeoutExpired:
+                probe = None
+            if probe is not None and probe.returncode == 0:
+                self._compose_base_cmd = [docker_bin, "compose"]
+        if self._compose_base_cmd is None and docker_compose_bin:
+            self._compose_base_cmd = [docker_compose_bin]
+        return self._compose_base_cmd
+
+    def _compose_cmd(self) -> list[str] | None:
+        compose_cmd = self._detect_compose_cmd()
+        if compose_cmd is None:
+            return None
+        return compose_cmd + [
+            "-f",
+            str(self.compose_path),
+            "-p",
+            self.compose_project,
+        ]
+
     def _run_compose(
         self, instance: AgentInstance, action: str, include_volumes: bool = False
     ) -> tuple[bool, str]:
-        compose_path = self._write_compose()
-        docker_bin = shutil.which("docker")
-        docker_compose_bin = shutil.which("docker-compose")
-        base_cmd: list[str] | None = None
+        self._write_compose()
+        return self._exec_compose(
+            self._compose_args(instance, action, include_volumes)
+        )
 
-        if docker_bin:
-            probe = subprocess.run(
-                [docker_bin, "compose", "version"],
+    async def _run_compose_async(
+        self, instance: AgentInstance, action: str, include_volumes: bool = False
+    ) -> tuple[bool, str]:
+        # The spec and argv are built here on the loop thread, which owns
+        # `self.instances`; the worker only runs the finished command
+        self._write_compose()
+        args = self._compose_args(instance, action, include_volumes)
+        return await asyncio.to_thread(self._exec_compose, args)
+
+    @staticmethod
+    def _compose_args(
+        instance: AgentInstance, action: str, include_volumes: bool = False
+    ) -> list[str]:
+        if action == "up":
+            return ["up", "-d", instance.service_name]
+        if action == "stop":
+            return ["stop", instance.service_name]
+        if action == "rm":
+            args = ["rm", "-s", "-f"]
+            if include_volumes:
+                args.append("-v")
+            args.append(instance.service_name)
+            return args
+        return [action, instance.service_name]
+
+    def _exec_compose(self, args: list[str]) -> tuple[bool, str]:
+        """Run a compose subcommand against the written compose file."""
+        base_cmd = self._compose_cmd()
+        if base_cmd is None:
+            return False, "docker compose not found"
+
+        try:
+            result = subprocess.run(
+                base_cmd + args,
+                cwd=self.compose_path.parent,
                 capture_output=True,
                 text=True,
                 check=False,
             )
-            if probe.returncode == 0:
-                base_cmd = [
-                    docker_bin,
-                    "compose",
-                    "-f",
-                    str(compose_path),
-                    "-p",
-                    self.compose_project,
-                ]
-        if base_cmd is None and docker_compose_bin:
-            base_cmd = [
-                docker_compose_bin,
-                "-f",
-                str(compose_path),
-                "-p",
-                self.compose_project,
-            ]
-        if base_cmd is None:
+        except FileNotFoundError:
+            # The cached CLI went away (uninstalled/moved); probe again next time
+            self._compose_base_cmd = None
             return False, "docker compose not found"
-
-        if action == "up":
-            cmd = base_cmd + ["up", "-d", instance.service_name]
-        elif action == "stop":
-            cmd = base_cmd + ["stop", instance.service_name]
-        elif action == "rm":
-            cmd = base_cmd + ["rm", "-s", "-f"]
-            if include_volumes:
-                cmd.append("-v")
-            cmd.append(instance.service_name)
-        else:
-            cmd = base_cmd + [action, instance.service_name]
-
-        result = subprocess.run(
-            cmd,
-            cwd=self.compose_path.parent,
-            capture_output=True,
-            text=True,
-            env=os.environ.copy(),
-            check=False,
-        )
         output = (result.stderr or "").strip() or (result.stdout or "").strip()
         return result.returncode == 0, output
 
     def _get_compose_status(self, instance: AgentInstance) -> InstanceStatus:
+        if self.docker_client is not None:
+            from docker.errors import DockerException
+            from requests.exceptions import RequestException
+
+            try:
+                containers = self.docker_client.containers.list(
+                    filters={"name": instance.hostname, "status": "running"}
+                )
+            except (DockerException, RequestException):
+                # The daemon went away (restart/stop); drop the stale client so
+                # _init_docker_client reconnects, and use the CLI for now
+                self._drop_docker_client()
+                containers = None
+            if containers is not None:
+                # the name filter is a substring match, so compare exactly
+                if any(c.name == instance.hostname for c in containers):
+                    return InstanceStatus.RUNNING
+                return InstanceStatus.STOPPED
         if not self.compose_path.exists():
             return InstanceStatus.STOPPED
-        docker_bin = shutil.which("docker")
-        docker_compose_bin = shutil.which("docker-compose")
-        base_cmd: list[str] | None = None
-        if docker_bin:
-            probe = subprocess.run(
-                [docker_bin, "compose", "version"],
-                capture_output=True,
-                text=True,
-                check=False,
-            )
-            if probe.returncode == 0:
-                base_cmd = [
-                    docker_bin,
-                    "compose",
-                    "-f",
-                    str(self.compose_path),
-                    "-p",
-                    self.compose_project,
-                ]
-        if base_cmd is None and docker_compose_bin:
-            base_cmd = [
-                docker_compose_bin,
-                "-f",
-                str(self.compose_path),
-                "-p",
-                self.compose_project,
-            ]
+        base_cmd = self._compose_cmd()
         if base_cmd is None:
             return InstanceStatus.ERROR
 
@@ -521,11 +655,47 @@ class InstanceManagerApp(App):
             "status=running",
             instance.service_name,
         ]
-        result = subprocess.run(cmd, capture_output=True, text=True, check=False)
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True, check=False)
+        except FileNotFoundError:
+            self._compose_base_cmd = None
+            return InstanceStatus.ERROR
         if result.returncode == 0 and instance.service_name in result.stdout:
             return InstanceStatus.RUNNING
         return InstanceStatus.STOPPED
 
+    def _bulk_status(self) -> Optional[Dict[str, InstanceStatus]]:
+        """Return container name -> status for the whole compose project.
+
+        Uses a single sparse Docker API call (no per-container inspect);
+        returns None when the SDK client is unavailable so callers can fall
+        back to per-instance queries.
+        """
+        if self.docker_client is None:
+            return None
+        from docker.errors import DockerException
+        from requests.exceptions import RequestException
+
+        try:
+            containers = self.docker_client.containers.list(
+                all=True,
+                filters={"label": f"com.docker.compose.project={self.compose_project}"},
+                sparse=True,
+                ignore_removed=True,
+            )
+        except (DockerException, RequestException):
+            self._drop_docker_client()
+            return None
+        # Sparse results carry only the list fields: "Names" is "/"-prefixed
+        return {
+            container.attrs["Names"][0].lstrip("/"): (
+                InstanceStatus.RUNNING
+                if container.attrs["State"] == "running"
+                else InstanceStatus.STOPPED
+            )
+            for container in containers
+        }
+
     def action_connect_ssh(self) -> None:
         inst = self.get_selected_instance()
         if not inst or inst.status != InstanceStatus.RUNNING:
@@ -689,9 +859,16 @@ class InstanceManagerApp(App):
         asyncio.create_task(self._refresh_async())
 
     async def _refresh_async(self) -> None:
-        self._write_compose()
-        for inst in self.instances.values():
-            inst.status = self._get_compose_status(inst)
+        statuses = await asyncio.to_thread(self._bulk_status)
+        if statuses is None:
+            # the CLI status fallback reads the compose file
+            self._write_compose()
+        # a snapshot: instances can be created or deleted across the awaits
+        for inst in list(self.instances.values()):
+            if statuses is None:
+                inst.status = await asyncio.to_thread(self._get_compose_status, inst)
+            else:
+                inst.status = statuses.get(inst.hostname, InstanceStatus.STOPPED)
         self.save_config()
         self.refresh_table()
 
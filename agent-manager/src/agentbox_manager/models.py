@@ -2,11 +2,14 @@ from __future__ import annotations
 
 import json
 import re
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Optional
 
+_NON_ALNUM_RE = re.compile(r"[^0-9a-zA-Z]+")
+
 
 class InstanceStatus(Enum):
     STOPPED = "stopped"
@@ -16,7 +19,24 @@ class InstanceStatus(Enum):
     ERROR = "error"
 
 
-@dataclass
+@lru_cache(maxsize=256)
+def _service_name(name: str, workspace_folder: str) -> str:
+    # Prefer a sanitized instance `name` if provided, otherwise fall back to workspace folder name
+    base = name or Path(workspace_folder).name
+    # sanitize: allow letters/numbers/underscore, convert other chars to underscore
+    sanitized = _NON_ALNUM_RE.sub("_", base).strip("_").lower()
+    return sanitized or Path(workspace_folder).name.replace("-", "_").lower()
+
+
+@lru_cache(maxsize=256)
+def _hostname(name: str, workspace_folder: str) -> str:
+    # Use the instance name for hostname if available, otherwise workspace folder
+    base = name or Path(workspace_folder).name
+    sanitized = _NON_ALNUM_RE.sub("-", base).strip("-").lower()
+    return f"agentbox-{sanitized}"
+
+
+@dataclass(slots=True)
 class AgentInstance:
     name: str
     workspace_folder: str
@@ -34,29 +54,34 @@ class AgentInstance:
     @property
     def service_name(self) -> str:
         """Generate docker-compose service name based on folder."""
-        # Prefer a sanitized instance `name` if provided, otherwise fall back to workspace folder name
-        base = self.name or Path(self.workspace_folder).name
-        # sanitize: allow letters/numbers/underscore, convert other chars to underscore
-        sanitized = re.sub(r"[^0-9a-zA-Z]+", "_", base).strip("_").lower()
-        return sanitized or Path(self.workspace_folder).name.replace("-", "_").lower()
+        return _service_name(self.name, self.workspace_folder)
 
     @property
     def hostname(self) -> str:
         """Generate hostname based on folder."""
-        # Use the instance name for hostname if available, otherwise workspace folder
-        base = self.name or Path(self.workspace_folder).name
-        sanitized = re.sub(r"[^0-9a-zA-Z]+", "-", base).strip("-").lower()
-        return f"agentbox-{sanitized}"
+        return _hostname(self.name, self.workspace_folder)
 
     def to_dict(self) -> Dict:
-        data = asdict(self)
-        data["status"] = self.status.value
-        return data
+        # Explicit literal: all fields are scalars, so asdict()'s deep copy is moot
+        return {
+            "name": self.name,
+            "workspace_folder": self.workspace_folder,
+            "cpu_cores": self.cpu_cores,
+            "memory_mb": self.memory_mb,
+            "priority": self.priority,
+            "ssh_port": self.ssh_port,
+            "rdp_port": self.rdp_port,
+            "puid": self.puid,
+            "pgid": self.pgid,
+            "status": self.status.value,
+            "compose_file": self.compose_file,
+            "container_id": self.container_id,
+        }
 
     @classmethod
-    def from_dict(cls, data: Dict) -> "AgentInstance":
-        # Copy to avoid mutating caller data
-        payload = dict(data)
+    def from_dict(cls, data: Dict, *, copy: bool = True) -> "AgentInstance":
+        # Copy to avoid mutating caller data, unless the caller hands it over
+        payload = dict(data) if copy else data
 
         # Handle legacy field names (vnc_port) and status serialization
         if "status" in payload:
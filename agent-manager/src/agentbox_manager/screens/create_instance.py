@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import os
-import pwd
 from pathlib import Path
 from typing import Optional
 
@@ -148,10 +147,12 @@ class CreateInstanceScreen(ModalScreen[Optional[AgentInstance]]):
                 yield Input(placeholder="3390", value="3390", id="rdp-port-input")
 
                 try:
+                    import pwd
+
                     current_user = pwd.getpwuid(os.getuid())
                     default_puid = str(current_user.pw_uid)
                     default_pgid = str(current_user.pw_gid)
-                except OSError:
+                except (ImportError, KeyError, OSError):
                     default_puid = "1000"
                     default_pgid = "1000"
 
@@ -3,8 +3,6 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Optional
 
-import docker
-from docker.errors import DockerException
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Horizontal, Vertical
@@ -45,24 +43,36 @@ class StartupScreen(ModalScreen[Optional[tuple[str, str]]]):
         table = self.query_one("#running-instances-table", DataTable)
         table.clear()
         running_instances = []
-        try:
-            docker_client = docker.from_env()
-            containers = docker_client.containers.list(
-                all=True, filters={"name": "agentbox"}
-            )
-            for container in containers:
-                container_name = container.name or "unknown"
-                name = container_name.replace("agentbox_", "").replace("agentbox-", "")
-                status = "Running" if container.status == "running" else "Stopped"
-                ports = container.ports or {}
-                ssh_port = ports.get("22/tcp", [{}])[0].get("HostPort", "N/A")
-                rdp_port = ports.get("3389/tcp", [{}])[0].get("HostPort", "N/A")
-                action = "Connect" if container.status == "running" else "Start"
-                if container.status == "running":
-                    table.add_row(name, status, ssh_port, rdp_port, action, key=name)
-                    running_instances.append(name)
-        except DockerException as exc:
-            table.add_row("Error", f"Failed to load: {exc}", "-", "-", "-", key="error")
+        # Reuse the app's Docker client instead of opening a new connection
+        docker_client = getattr(self.app, "docker_client", None)
+        if docker_client is None:
+            table.add_row("Docker", "Not available", "-", "-", "-", key="nodocker")
+        else:
+            from docker.errors import DockerException
+
+            try:
+                containers = docker_client.containers.list(
+                    all=True, filters={"name": "agentbox"}
+                )
+                for container in containers:
+                    container_name = container.name or "unknown"
+                    name = container_name.replace("agentbox_", "").replace(
+                        "agentbox-", ""
+                    )
+                    status = "Running" if container.status == "running" else "Stopped"
+                    ports = container.ports or {}
+                    ssh_port = ports.get("22/tcp", [{}])[0].get("HostPort", "N/A")
+                    rdp_port = ports.get("3389/tcp", [{}])[0].get("HostPort", "N/A")
+                    action = "Connect" if container.status == "running" else "Start"
+                    if container.status == "running":
+                        table.add_row(
+                            name, status, ssh_port, rdp_port, action, key=name
+                        )
+                        running_instances.append(name)
+            except DockerException as exc:
+                table.add_row(
+                    "Error", f"Failed to load: {exc}", "-", "-", "-", key="error"
+                )
         subtitle = self.query_one("#subtitle", Static)
         if running_instances:
             subtitle.update(f"Found {len(running_instances)} running instance(s).")
@@ -3,14 +3,93 @@ from __future__ import annotations
 import asyncio
 import fcntl
 import os
-import subprocess
+import signal
+import string
+import struct
+import termios
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import Optional
 
 import pyte
+from pyte.screens import wcwidth
+from textual.content import Content
 from textual.message import Message
-from textual.reactive import reactive
 from textual.widget import Widget
 
+# Bytes sent to the PTY per Textual key: ASCII characters map to themselves
+# (prebuilt so typing allocates nothing), named keys to their control codes.
+_KEY_BYTES: dict[str, bytes] = {chr(i): bytes([i]) for i in range(128)}
+_KEY_BYTES.update(
+    {f"ctrl+{c}": bytes([i + 1]) for i, c in enumerate(string.ascii_lowercase)}
+)
+_KEY_BYTES.update(
+    {
+        "enter": b"\r",
+        "tab": b"\t",
+        "backspace": b"\x7f",
+        "escape": b"\x1b",
+        "space": b" ",
+        "up": b"\x1b[A",
+        "down": b"\x1b[B",
+        "right": b"\x1b[C",
+        "left": b"\x1b[D",
+        "home": b"\x1b[H",
+        "end": b"\x1b[F",
+        "insert": b"\x1b[2~",
+        "delete": b"\x1b[3~",
+        "pageup": b"\x1b[5~",
+        "pagedown": b"\x1b[6~",
+        "shift+tab": b"\x1b[Z",
+        "f1": b"\x1bOP",
+        "f2": b"\x1bOQ",
+        "f3": b"\x1bOR",
+        "f4": b"\x1bOS",
+        "f5": b"\x1b[15~",
+        "f6": b"\x1b[17~",
+        "f7": b"\x1b[18~",
+        "f8": b"\x1b[19~",
+        "f9": b"\x1b[20~",
+        "f10": b"\x1b[21~",
+        "f11": b"\x1b[23~",
+        "f12": b"\x1b[24~",
+    }
+)
+
+
+def _signal_group(pid: int, sig: int) -> None:
+    # The child is a session leader, so its pid is also its process group id
+    try:
+        os.killpg(pid, sig)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+async def _reap(pid: int, grace: float, poll: float) -> None:
+    """Wait for `pid` without tying up a thread; SIGKILL it after `grace`.
+
+    A child that ignores SIGHUP/SIGTERM would otherwise hold app exit until
+    it chose to quit. If the loop shuts down first the group is killed
+    rather than left running.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + grace
+    try:
+        while True:
+            try:
+                done, _ = os.waitpid(pid, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if done:
+                return
+            if deadline is not None and loop.time() >= deadline:
+                _signal_group(pid, signal.SIGKILL)
+                deadline = None
+            await asyncio.sleep(poll)
+    except asyncio.CancelledError:
+        _signal_group(pid, signal.SIGKILL)
+        raise
+
 
 class TerminalClosed(Message):
     pass
@@ -19,7 +98,7 @@ class TerminalClosed(Message):
 class TerminalWidget(Widget):
     """A very small terminal emulator widget using pyte and a PTY.
 
-    This is minimal: it reads from a PTY, feeds bytes to `pyte.Stream`, and
+    This is minimal: it reads from a PTY, feeds bytes to `pyte.ByteStream`, and
     renders the screen content as plain text. It forwards keyboard bytes to
     the PTY master. It does not implement mouse support or full VT100 features.
     """
@@ -28,7 +107,21 @@ class TerminalWidget(Widget):
     master_fd: Optional[int] = None
     cols: int = 80
     rows: int = 24
-    screen = reactive("")
+    # Bytes requested per os.read; large enough to drain a burst in few calls
+    READ_SIZE = 65536
+    # Reads per readable event, so a child that writes nonstop (`yes`, a
+    # build log) cannot keep the loop in _on_readable forever
+    READ_BUDGET = 4
+    # Stop reading once this much output awaits the (slower) pyte thread, so
+    # a fast producer is throttled to parse speed instead of piling up
+    PENDING_HIGH_WATER = 1 << 20
+    # Render at most this often while output keeps streaming (~60 Hz)
+    FRAME_INTERVAL = 0.016
+    # Output arriving after this much silence is drawn immediately
+    IDLE_THRESHOLD = 0.002
+    # Seconds a closed child gets to exit before SIGKILL, and the poll step
+    REAP_GRACE = 1.0
+    REAP_POLL = 0.05
 
     def __init__(
         self, cmd: list[str] = ["/bin/bash"], *, cols: int = 80, rows: int = 24
@@ -38,48 +131,267 @@ class TerminalWidget(Widget):
         self.cols = cols
         self.rows = rows
         self.py_screen = pyte.Screen(self.cols, self.rows)
-        self.stream = pyte.Stream(self.py_screen)
+        # ByteStream decodes incrementally, so UTF-8 sequences split across
+        # reads are not mangled into U+FFFD
+        self.stream = pyte.ByteStream(self.py_screen)
+        # Rendered text; a plain attribute (a reactive named `screen` shadowed
+        # Widget.screen) so each frame costs one explicit refresh, no watchers
+        self.screen_text: str = ""
+        # render() hands Textual this prebuilt plain Content; returning the str
+        # made Textual re-parse the whole screen as markup on every frame
+        self._content = Content("")
+        # pyte parsing is pure Python and can hog the loop on big bursts, so it
+        # runs on one dedicated thread; a single worker serialises pyte access
+        self._feed_pool = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="pyte-feed"
+        )
+        self._feed_future: Optional[asyncio.Future] = None
+        self._pending = bytearray()
+        self._close_pending = False
+        # Set on unmount; a feed still running then must not queue another
+        self._closed = False
+        # True while the reader is off because `_pending` hit the high water
+        self._reading_paused = False
+        # Rendered rows, updated from the dirty rows reported by each feed
+        self._lines: list[str] = [""] * self.rows
+        self._dirty = False
+        self._last_data = 0.0
+        self._flush_handle: Optional[asyncio.Handle] = None
+        # Input not yet accepted by the PTY, flushed by _try_flush_write()
+        self._wbuf = bytearray()
+        self._writer_registered = False
+        # Reaps the child after the PTY closes; kept so the task is not lost
+        self._reaper: Optional[asyncio.Task] = None
 
     async def on_mount(self) -> None:
         # Open a pty and spawn the process
         self.master_fd, slave_fd = os.openpty()
-        # set non-blocking
-        fl = fcntl.fcntl(self.master_fd, fcntl.F_GETFL)
-        fcntl.fcntl(self.master_fd, fcntl.F_SETFL, fl | os.O_NONBLOCK)
-        self.proc = subprocess.Popen(
-            self.cmd, stdin=slave_fd, stdout=slave_fd, stderr=slave_fd, close_fds=True
+        os.set_blocking(self.master_fd, False)
+        # Size the PTY to match the pyte screen so the child wraps correctly
+        fcntl.ioctl(
+            self.master_fd,
+            termios.TIOCSWINSZ,
+            struct.pack("HHHH", self.rows, self.cols, 0, 0),
+        )
+        # posix_spawn takes the vfork-style fast path instead of copying this
+        # (large) process's page tables on fork; our other fds are CLOEXEC.
+        # The child leads a new session and opens the slave by path, making
+        # the PTY its controlling terminal: closing the master then hangs up
+        # its whole process group, as closing a terminal window would.
+        self.process_pid = os.posix_spawnp(
+            self.cmd[0],
+            self.cmd,
+            os.environ,
+            file_actions=[
+                (os.POSIX_SPAWN_OPEN, 0, os.ttyname(slave_fd), os.O_RDWR, 0),
+                (os.POSIX_SPAWN_DUP2, 0, 1),
+                (os.POSIX_SPAWN_DUP2, 0, 2),
+                (os.POSIX_SPAWN_CLOSE, slave_fd),
+            ],
+            setsid=True,
         )
-        self.process_pid = self.proc.pid
         os.close(slave_fd)
-        asyncio.create_task(self._read_loop())
+        # Let the event loop watch the fd; reads then happen inline, only when
+        # data is ready, instead of bouncing every read through a thread pool.
+        asyncio.get_running_loop().add_reader(self.master_fd, self._on_readable)
 
-    async def _read_loop(self) -> None:
-        loop = asyncio.get_event_loop()
-        while True:
+    def _on_readable(self) -> None:
+        # Drain what the PTY has queued, up to the budget, straight into the
+        # next batch; anything left re-triggers the reader next iteration
+        pending = self._pending
+        eof = False
+        for _ in range(self.READ_BUDGET):
             try:
-                data = await loop.run_in_executor(None, os.read, self.master_fd, 4096)
-            except Exception:
-                data = b""
-            if not data:
+                chunk = os.read(self.master_fd, self.READ_SIZE)
+            except BlockingIOError:
                 break
-            try:
-                self.stream.feed(data.decode("utf-8", "replace"))
-            except Exception:
-                pass
-            # Update screen text from pyte buffer
-            text = "\n".join(self.py_screen.display)
-            self.screen = text
-            self.refresh()
-        await self.emit(TerminalClosed())
-
-    def render(self) -> str:
-        return self.screen
+            except OSError:
+                # EIO once the child side of the PTY is closed
+                eof = True
+                break
+            if not chunk:
+                eof = True
+                break
+            pending += chunk
+        if eof:
+            self._close_pty()
+            self._close_pending = True
+        self._maybe_feed()
+        if (
+            self._feed_future is not None
+            and self.master_fd is not None
+            and len(self._pending) >= self.PENDING_HIGH_WATER
+        ):
+            asyncio.get_running_loop().remove_reader(self.master_fd)
+            self._reading_paused = True
 
-    async def key_press(self, event) -> None:  # placeholder for Textual key events
-        if not self.master_fd:
+    def _maybe_feed(self) -> None:
+        """Hand pending output to the feed thread, one batch at a time.
+
+        Output read while a batch is being parsed accumulates in `_pending`
+        and goes out as the next batch. After EOF a final batch flushes the
+        UTF-8 decoder and TerminalClosed is posted once it is parsed.
+        """
+        if self._closed or self._feed_future is not None:
+            return
+        if not (self._pending or self._close_pending):
             return
-        data = event.key.encode("utf-8")
+        data, self._pending = self._pending, bytearray()
+        final, self._close_pending = self._close_pending, False
+        loop = asyncio.get_running_loop()
+        self._feed_future = loop.run_in_executor(
+            self._feed_pool, self._feed_and_render, data, final
+        )
+        self._feed_future.add_done_callback(partial(self._on_fed, final))
+
+    def _feed_and_render(self, data: bytearray, final: bool) -> dict[int, str]:
+        # Runs on the feed thread, the only thread that touches pyte state
         try:
-            os.write(self.master_fd, data)
+            self.stream.feed(data)
+            if final and self.stream.use_utf8:
+                # A sequence cut off by EOF becomes U+FFFD instead of vanishing
+                tail = self.stream.utf8_decoder.decode(b"", final=True)
+                if tail:
+                    pyte.Stream.feed(self.stream, tail)
         except Exception:
             pass
+        dirty = self.py_screen.dirty
+        rows = {y: self._render_row(y) for y in dirty}
+        dirty.clear()
+        return rows
+
+    def _on_fed(self, final: bool, future: asyncio.Future) -> None:
+        self._feed_future = None
+        if self._closed or future.cancelled():
+            return
+        rows = future.result()
+        if rows:
+            for y, text in rows.items():
+                self._lines[y] = text
+            self._schedule_render()
+        if final:
+            self.post_message(TerminalClosed())
+            return
+        self._maybe_feed()
+        if self._reading_paused and self.master_fd is not None:
+            # The backlog went out as the next batch; resume reading
+            self._reading_paused = False
+            asyncio.get_running_loop().add_reader(self.master_fd, self._on_readable)
+
+    def on_unmount(self) -> None:
+        self._closed = True
+        if self.process_pid is not None:
+            _signal_group(self.process_pid, signal.SIGHUP)
+            _signal_group(self.process_pid, signal.SIGTERM)
+        self._close_pty()
+        self._pending.clear()
+        self._close_pending = False
+        self._feed_pool.shutdown(wait=False, cancel_futures=True)
+
+    def _close_pty(self) -> None:
+        """Release the PTY fd and its loop callbacks, then reap the child.
+
+        Safe to call more than once; without it every terminal leaked an fd.
+        """
+        fd = self.master_fd
+        if fd is None:
+            return
+        self.master_fd = None
+        loop = asyncio.get_running_loop()
+        loop.remove_reader(fd)
+        if self._writer_registered:
+            loop.remove_writer(fd)
+            self._writer_registered = False
+        self._wbuf.clear()
+        os.close(fd)
+        pid, self.process_pid = self.process_pid, None
+        if pid is not None:
+            self._reaper = loop.create_task(
+                _reap(pid, self.REAP_GRACE, self.REAP_POLL)
+            )
+
+    def _schedule_render(self) -> None:
+        """Coalesce renders: at most one per frame while output keeps streaming.
+
+        Data arriving after a quiet spell (typically keystroke echo) is drawn
+        on the next loop iteration so typing stays snappy.
+        """
+        self._dirty = True
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        idle = now - self._last_data > self.IDLE_THRESHOLD
+        self._last_data = now
+        if self._flush_handle is not None:
+            return
+        if idle:
+            self._flush_handle = loop.call_soon(self._flush_render)
+        else:
+            self._flush_handle = loop.call_later(
+                self.FRAME_INTERVAL, self._flush_render
+            )
+
+    def _flush_render(self) -> None:
+        self._flush_handle = None
+        if not self._dirty:
+            return
+        self._dirty = False
+        self.screen_text = "\n".join(self._lines)
+        self._content = Content(self.screen_text)
+        self.refresh(layout=False)
+
+    def _render_row(self, y: int) -> str:
+        """Render one pyte row, as `Screen.display` does for every row."""
+        line = self.py_screen.buffer[y]
+        chars = []
+        is_wide_char = False
+        for x in range(self.py_screen.columns):
+            if is_wide_char:  # skip the stub cell after a wide character
+                is_wide_char = False
+                continue
+            char = line[x].data
+            # pyte's own memoised wcwidth, as used by Screen.display
+            is_wide_char = wcwidth(char[0]) == 2
+            chars.append(char)
+        return "".join(chars)
+
+    def render(self) -> Content:
+        return self._content
+
+    async def key_press(self, event) -> None:  # placeholder for Textual key events
+        if not self.master_fd:
+            return
+        data = _KEY_BYTES.get(event.key)
+        if data is None:
+            # Textual names punctuation keys (e.g. "exclamation_mark"); the
+            # typed character is what the PTY needs. Unmapped keys with no
+            # character (e.g. "ctrl+left") are dropped, not sent as words
+            char = getattr(event, "character", None)
+            if not char:
+                return
+            data = _KEY_BYTES.get(char) or char.encode("utf-8")
+        self._wbuf += data
+        self._try_flush_write()
+
+    def _try_flush_write(self) -> None:
+        """Write pending input; wait for the fd to drain if the PTY is full.
+
+        Large pastes can fill the PTY buffer, making a non-blocking write fail
+        or come up short; the remainder stays in `_wbuf` until writable.
+        """
+        if self.master_fd is None:
+            return
+        try:
+            written = os.write(self.master_fd, self._wbuf)
+        except BlockingIOError:
+            written = 0
+        except OSError:
+            # PTY is gone; nothing will ever read the pending input
+            written = len(self._wbuf)
+        del self._wbuf[:written]
+        loop = asyncio.get_running_loop()
+        if self._wbuf and not self._writer_registered:
+            loop.add_writer(self.master_fd, self._try_flush_write)
+            self._writer_registered = True
+        elif not self._wbuf and self._writer_registered:
+            loop.remove_writer(self.master_fd)
+            self._writer_registered = False
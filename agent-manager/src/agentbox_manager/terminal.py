@@ -1,7 +1,9 @@
 """Terminal helper utilities for attaching to container ttys and restoring terminal state.
 
-Provides a single entrypoint `attach_command` which tries `subprocess.run`, then
-`pty.spawn`, then an `execvp` handoff, restoring terminal state before/after.
+Provides a single entrypoint `attach_command` which tries `subprocess.run` (when
+stdin is a TTY), then `pty.spawn`, then an `execvp` handoff, restoring terminal
+state before/after. Set `AGENTBOX_ATTACH_LOG=1` to trace attempts in
+/tmp/agentbox-attach.log.
 """
 
 from __future__ import annotations
@@ -9,91 +11,125 @@ from __future__ import annotations
 import os
 import pty
 import subprocess
+import sys
 import time
-from typing import Sequence
+from typing import Optional, Sequence, TextIO
+
+_ATTACH_LOG_PATH = "/tmp/agentbox-attach.log"
+# leave the alternate screen, show the cursor, disable mouse reporting
+_RESTORE_SEQUENCE = "\x1b[?1049l\x1b[?25h\x1b[?1000l"
+_RESTORE_INTERVAL = 0.5
+_LAST_RESTORE = 0.0
 
 
 def restore_terminal() -> None:
-    """Attempt to restore common terminal modes and disable mouse reporting."""
+    """Attempt to restore common terminal modes and disable mouse reporting.
+
+    Calls within `_RESTORE_INTERVAL` seconds of the previous restore are
+    skipped, since the terminal cannot have been re-dirtied in between.
+    """
+    global _LAST_RESTORE
+    now = time.monotonic()
+    if now - _LAST_RESTORE < _RESTORE_INTERVAL:
+        return
+    _LAST_RESTORE = now
     try:
         subprocess.run(["stty", "sane"], check=False)
     except Exception:
         pass
     try:
-        subprocess.run(["tput", "rmcup"], check=False)
-    except Exception:
-        pass
-    try:
-        subprocess.run(["tput", "cnorm"], check=False)
-    except Exception:
-        pass
-    try:
-        # disable mouse reporting in case the remote enabled it
-        subprocess.run(["bash", "-lc", "printf '\\e[?1000l'"], check=False)
+        # Emit directly what `tput rmcup`, `tput cnorm` and a mouse-off printf
+        # produced, rather than spawning a process for each
+        sys.stdout.write(_RESTORE_SEQUENCE)
+        sys.stdout.flush()
     except Exception:
         pass
 
 
-def attach_command(cmd: Sequence[str], delay: float = 1.5) -> bool:
-    """Attach to an interactive command using several fallbacks.
+def _stdin_isatty() -> bool:
+    try:
+        return sys.stdin is not None and sys.stdin.isatty()
+    except (AttributeError, ValueError):
+        return False
 
-    Returns True if the attach completed (exit code 0) or the process replaced
-    the current process (execvp). Returns False on failure.
-    """
-    # allow caller to teardown UI/TTY first
-    time.sleep(delay)
-    restore_terminal()
 
-    # diagnostic log for troubleshooting attach issues
+def _open_attach_log() -> Optional[TextIO]:
+    """Open the attach diagnostic log if enabled via AGENTBOX_ATTACH_LOG=1."""
+    if not (
+        os.environ.get("AGENTBOX_ATTACH_LOG") or os.environ.get("TOADBOX_ATTACH_LOG")
+    ):
+        return None
     try:
-        with open("/tmp/agentbox-attach.log", "a", encoding="utf-8") as fh:
-            fh.write(f"--- attach attempt: {time.asctime()}\n")
-            fh.write(f"cmd: {cmd}\n")
-    except Exception:
-        pass
+        return open(_ATTACH_LOG_PATH, "a", encoding="utf-8", buffering=1)
+    except OSError:
+        return None
+
 
-    # 1) Try a simple subprocess.run (friendly for tests/mocks)
+def _log(log: Optional[TextIO], message: str) -> None:
+    if log:
+        log.write(f"{message}\n")
+
+
+def _try_subprocess(cmd: Sequence[str], log: Optional[TextIO]) -> bool:
+    # The child inherits our stdio, so without a TTY an interactive command
+    # can only fail; go straight to pty.spawn then.
+    if not _stdin_isatty():
+        return False
     try:
         result = subprocess.run(list(cmd), check=False)
-        if result and getattr(result, "returncode", 0) == 0:
-            try:
-                with open("/tmp/agentbox-attach.log", "a", encoding="utf-8") as fh:
-                    fh.write(f"subprocess.run returned {result.returncode}\n")
-            except Exception:
-                pass
-            return True
     except Exception:
-        pass
+        return False
+    if result and getattr(result, "returncode", 0) == 0:
+        _log(log, f"subprocess.run returned {result.returncode}")
+        return True
+    return False
+
 
-    # 2) Try PTY spawn for interactive tty forwarding
+def _try_pty_spawn(cmd: Sequence[str], log: Optional[TextIO]) -> bool:
     try:
         pty.spawn(list(cmd))
-        try:
-            with open("/tmp/agentbox-attach.log", "a", encoding="utf-8") as fh:
-                fh.write("pty.spawn returned\n")
-        except Exception:
-            pass
-        return True
     except Exception:
-        pass
+        return False
+    _log(log, "pty.spawn returned")
+    return True
+
 
-    # 3) Try execvp handoff — this will not return on success
+def _try_execvp(cmd: Sequence[str], log: Optional[TextIO]) -> bool:
+    # this will not return on success
+    _log(log, "attempting execvp")
     try:
-        try:
-            with open("/tmp/agentbox-attach.log", "a", encoding="utf-8") as fh:
-                fh.write("attempting execvp\n")
-        except Exception:
-            pass
         os.execvp(cmd[0], list(cmd))
-        return True
     except Exception:
-        pass
+        return False
+    return True
+
+
+def attach_command(cmd: Sequence[str], delay: float = 1.5) -> bool:
+    """Attach to an interactive command using several fallbacks.
 
-    # final restore attempt
+    Returns True if the attach completed (exit code 0) or the process replaced
+    the current process (execvp). Returns False on failure.
+    """
+    # allow caller to teardown UI/TTY first
+    time.sleep(delay)
     restore_terminal()
+
+    # diagnostic log for troubleshooting attach issues, opened once per attach
+    log = _open_attach_log()
     try:
-        with open("/tmp/agentbox-attach.log", "a", encoding="utf-8") as fh:
-            fh.write("attach failed\n")
-    except Exception:
-        pass
-    return False
+        _log(log, f"--- attach attempt: {time.asctime()}")
+        _log(log, f"cmd: {cmd}")
+
+        # 1) a simple subprocess.run (friendly for tests/mocks), 2) PTY spawn
+        # for interactive tty forwarding, 3) an execvp handoff
+        for attempt in (_try_subprocess, _try_pty_spawn, _try_execvp):
+            if attempt(cmd, log):
+                return True
+
+        # final restore attempt
+        restore_terminal()
+        _log(log, "attach failed")
+        return False
+    finally:
+        if log:
+            log.close()
@@ -1,5 +1,12 @@
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+from textual.widgets import DataTable
+
 from agentbox_manager.app import InstanceManagerApp
-from agentbox_manager.models import AgentInstance
+from agentbox_manager.models import AgentInstance, InstanceStatus
 
 
 class DummyTable:
@@ -11,8 +18,9 @@ class DummyTable:
     def row_count(self):
         return len(self._rows)
 
-    def get_row_at(self, idx):
-        return self._rows[idx]
+    def coordinate_to_cell_key(self, coordinate):
+        row_key = SimpleNamespace(value=self._rows[coordinate.row][0])
+        return SimpleNamespace(row_key=row_key)
 
 
 class DummyQuery:
@@ -53,3 +61,130 @@ def test_get_selected_instance_returns_instance(monkeypatch, tmp_path):
     monkeypatch.setattr(app, "query_one", lambda s, *a, **k: dummy_table)
     result = app.get_selected_instance()
     assert result is inst
+
+
+def test_create_instance_rejects_port_conflict(monkeypatch, tmp_path):
+    monkeypatch.setattr("agentbox_manager.app.Path.home", lambda: tmp_path)
+    app = InstanceManagerApp()
+    monkeypatch.setattr(app, "save_config", lambda: None)
+    monkeypatch.setattr(app, "refresh_table", lambda: None)
+    errors = []
+    monkeypatch.setattr(app, "show_error", errors.append)
+    app.create_instance(AgentInstance(name="foo", workspace_folder="/tmp/foo"))
+    assert app.suggest_ports() == (2223, 3391)
+    app.create_instance(
+        AgentInstance(name="bar", workspace_folder="/tmp/bar", rdp_port=3391)
+    )
+    assert "bar" not in app.instances
+    assert errors == ["Ports already in use by 'foo' (SSH)"]
+
+
+def test_update_row_updates_status_cell_only(monkeypatch, tmp_path):
+    monkeypatch.setattr("agentbox_manager.app.Path.home", lambda: tmp_path)
+    app = InstanceManagerApp()
+    inst = AgentInstance(name="foo", workspace_folder="/tmp/foo")
+    app.instances["foo"] = inst
+    updates = []
+
+    class FakeWidget:
+        def update_cell(self, row_key, column_key, value):
+            updates.append((row_key, column_key, value))
+
+        def update(self, text):
+            pass
+
+    monkeypatch.setattr(app, "query_one", lambda s, *a, **k: FakeWidget())
+    monkeypatch.setattr(
+        app, "refresh_table", lambda: (_ for _ in ()).throw(AssertionError())
+    )
+    app._update_row(inst)
+    assert updates == [("foo", "status", "[status-stopped]stopped[/status-stopped]")]
+
+
+def test_refresh_table_updates_rows_in_place(monkeypatch, tmp_path):
+    monkeypatch.setattr("agentbox_manager.app.Path.home", lambda: tmp_path)
+    app = InstanceManagerApp()
+    monkeypatch.setattr(app, "_init_docker_client", lambda: None)
+    monkeypatch.setattr(app, "_detect_compose_cmd", lambda: None)
+    app.instances = {
+        name: AgentInstance(name=name, workspace_folder=f"/tmp/{name}")
+        for name in ("one", "two", "three")
+    }
+
+    async def scenario():
+        async with app.run_test():
+            table = app.query_one("#instances-table", DataTable)
+            app.refresh_table()
+            table.move_cursor(row=2)
+            app.instances["three"].status = InstanceStatus.RUNNING
+            del app.instances["one"]
+            app.refresh_table()
+            assert [key.value for key in table.rows] == ["two", "three"]
+            assert "running" in table.get_cell("three", "status")
+            assert app.get_selected_instance() is app.instances["three"]
+
+    asyncio.run(scenario())
+
+
+def test_docker_probe_deferred_to_mount(monkeypatch, tmp_path):
+    monkeypatch.setattr("agentbox_manager.app.Path.home", lambda: tmp_path)
+    calls = []
+    monkeypatch.setattr(
+        InstanceManagerApp, "_init_docker_client", lambda self: calls.append(self)
+    )
+    app = InstanceManagerApp()
+    monkeypatch.setattr(app, "_detect_compose_cmd", lambda: calls.append("compose"))
+    assert calls == []
+    assert app.docker_client is None
+
+    async def scenario():
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            assert calls == [app, "compose"]
+
+    asyncio.run(scenario())
+
+
+def test_start_during_probe_waits_instead_of_connecting(monkeypatch, tmp_path):
+    monkeypatch.setattr("agentbox_manager.app.Path.home", lambda: tmp_path)
+    threads = []
+    active = []
+    peak = []
+
+    def slow_init(self):
+        active.append(1)
+        peak.append(len(active))
+        threads.append(threading.current_thread())
+        time.sleep(0.1)  # the from_env() daemon round trip
+        self.docker_cli_available = True
+        active.pop()
+
+    monkeypatch.setattr(InstanceManagerApp, "_init_docker_client", slow_init)
+    app = InstanceManagerApp()
+    monkeypatch.setattr(app, "_detect_compose_cmd", lambda: None)
+    monkeypatch.setattr(app, "_exec_compose", lambda args: (True, ""))
+    monkeypatch.setattr(
+        app, "_get_compose_status", lambda inst: InstanceStatus.RUNNING
+    )
+    monkeypatch.setattr(app, "save_config", lambda: None)
+    inst = AgentInstance(name="one", workspace_folder="/tmp/one")
+    app.instances = {inst.name: inst}
+
+    async def scenario():
+        async with app.run_test() as pilot:
+            # click Start while "Docker connecting..." is still showing
+            app.action_start_instance()
+            for _ in range(100):
+                if inst.status == InstanceStatus.RUNNING:
+                    break
+                await pilot.pause(0.02)
+            assert inst.status == InstanceStatus.RUNNING
+
+    asyncio.run(scenario())
+    assert threading.main_thread() not in threads
+    assert max(peak) == 1
+
+
+def test_button_actions_resolve_to_methods():
+    for handler_name in InstanceManagerApp._BUTTON_ACTIONS.values():
+        assert callable(getattr(InstanceManagerApp, handler_name))
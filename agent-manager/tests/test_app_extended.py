@@ -1,3 +1,5 @@
+import asyncio
+import threading
 from types import SimpleNamespace
 
 from docker.errors import DockerException
@@ -10,7 +12,7 @@ def make_app(monkeypatch, tmp_path):
     # Prevent docker.from_env side-effects during app init by causing it to raise
     # DockerException so the app falls back to docker_client = None
     monkeypatch.setattr(
-        "agentbox_manager.app.docker.from_env",
+        "docker.from_env",
         lambda: (_ for _ in ()).throw(DockerException()),
     )
     app = InstanceManagerApp()
@@ -235,6 +237,8 @@ def test_attach_to_container_executes_docker(monkeypatch, tmp_path):
 
     monkeypatch.setattr(app, "exit", fake_exit)
     monkeypatch.setattr("subprocess.run", fake_run)
+    # attach only uses subprocess.run when stdin is a terminal
+    monkeypatch.setattr("sys.stdin", SimpleNamespace(isatty=lambda: True))
     app._attach_to_container(inst)
     assert called.get("exit") is True
     assert "docker" in called.get("cmd", [])[0]
@@ -264,3 +268,150 @@ def test_attach_to_container_no_docker_client_shows_error(monkeypatch, tmp_path)
         "Docker is not available" in fake_status.text
         or "Container not found" in fake_status.text
     )
+
+
+def test_compose_cmd_detected_once(monkeypatch, tmp_path):
+    app = make_app(monkeypatch, tmp_path)
+    inst = AgentInstance(name="x", workspace_folder=str(tmp_path / "x"))
+    monkeypatch.setattr(
+        "shutil.which", lambda name: "/usr/bin/docker" if name == "docker" else None
+    )
+    probes = []
+
+    def fake_run(cmd, **kwargs):
+        if cmd[1:] == ["compose", "version"]:
+            probes.append(cmd)
+        return SimpleNamespace(returncode=0, stdout="ok", stderr="")
+
+    monkeypatch.setattr("subprocess.run", fake_run)
+    assert app._run_compose(inst, "up")[0]
+    assert app._run_compose(inst, "stop")[0]
+    app._get_compose_status(inst)
+    assert len(probes) == 1
+
+
+def test_get_compose_status_uses_docker_client(monkeypatch, tmp_path):
+    app = make_app(monkeypatch, tmp_path)
+    inst = AgentInstance(name="svc", workspace_folder=str(tmp_path / "svc"))
+    seen = {}
+
+    class FakeContainers:
+        def list(self, filters=None):
+            seen["filters"] = filters
+            # substring matches from the daemon must not count as running
+            return [SimpleNamespace(name=f"{inst.hostname}-2")]
+
+    app.docker_client = SimpleNamespace(containers=FakeContainers())
+    monkeypatch.setattr(
+        "subprocess.run", lambda *a, **k: (_ for _ in ()).throw(AssertionError())
+    )
+    assert app._get_compose_status(inst) == InstanceStatus.STOPPED
+    assert seen["filters"] == {"name": inst.hostname, "status": "running"}
+
+    FakeContainers.list = lambda self, filters=None: [
+        SimpleNamespace(name=inst.hostname)
+    ]
+    assert app._get_compose_status(inst) == InstanceStatus.RUNNING
+
+
+def test_refresh_uses_single_bulk_status_query(monkeypatch, tmp_path):
+    app = make_app(monkeypatch, tmp_path)
+    app.config_file = tmp_path / "config.json"
+    a = AgentInstance(name="one", workspace_folder="/work/one")
+    b = AgentInstance(name="two", workspace_folder="/work/two", ssh_port=2223)
+    app.instances = {a.name: a, b.name: b}
+    calls = []
+
+    class FakeContainers:
+        def list(self, all=False, filters=None, sparse=False, ignore_removed=False):
+            # a non-sparse list inspects every container: 1+N round trips
+            assert sparse and ignore_removed
+            calls.append(filters)
+            return [
+                SimpleNamespace(attrs={"Names": [f"/{a.hostname}"], "State": "running"})
+            ]
+
+    app.docker_client = SimpleNamespace(containers=FakeContainers())
+    monkeypatch.setattr(app, "refresh_table", lambda: None)
+    asyncio.run(app._refresh_async())
+    assert calls == [{"label": "com.docker.compose.project=agentbox"}]
+    assert a.status == InstanceStatus.RUNNING
+    assert b.status == InstanceStatus.STOPPED
+
+
+def test_write_compose_skips_unchanged_spec(monkeypatch, tmp_path):
+    app = make_app(monkeypatch, tmp_path)
+    inst = AgentInstance(name="x", workspace_folder=str(tmp_path / "x"))
+    app.instances = {inst.name: inst}
+    path = app._write_compose()
+    path.write_text("sentinel", encoding="utf-8")
+    app._write_compose()
+    assert path.read_text(encoding="utf-8") == "sentinel"
+    # changing the instance set rewrites the file
+    other = AgentInstance(name="y", workspace_folder=str(tmp_path / "y"))
+    app.instances[other.name] = other
+    app._write_compose()
+    assert other.service_name in path.read_text(encoding="utf-8")
+
+
+def test_docker_connection_error_falls_back_to_cli(monkeypatch, tmp_path):
+    from requests.exceptions import ConnectionError
+
+    app = make_app(monkeypatch, tmp_path)
+    inst = AgentInstance(name="svc", workspace_folder=str(tmp_path / "svc"))
+    app.instances = {inst.name: inst}
+    app.compose_path.write_text("dummy", encoding="utf-8")
+
+    closed = []
+
+    class DeadContainers:
+        def list(self, **kwargs):
+            raise ConnectionError("daemon gone")
+
+    def dead_client():
+        return SimpleNamespace(
+            containers=DeadContainers(), close=lambda: closed.append(True)
+        )
+
+    def fake_run(cmd, **kwargs):
+        if "ps" in cmd:
+            return SimpleNamespace(returncode=0, stdout=inst.service_name, stderr="")
+        return SimpleNamespace(returncode=0, stdout="", stderr="")
+
+    monkeypatch.setattr("shutil.which", lambda name: "/usr/bin/docker")
+    monkeypatch.setattr("subprocess.run", fake_run)
+
+    app.docker_client = dead_client()
+    assert app._get_compose_status(inst) == InstanceStatus.RUNNING
+    assert app.docker_client is None
+
+    app.docker_client = dead_client()
+    assert app._bulk_status() is None
+    assert app.docker_client is None
+    # stale clients are closed, not just dropped, so their pools are released
+    assert closed == [True, True]
+
+
+def test_compose_actions_build_spec_on_loop_thread(monkeypatch, tmp_path):
+    app = make_app(monkeypatch, tmp_path)
+    inst = AgentInstance(name="x", workspace_folder=str(tmp_path / "x"))
+    app.instances = {inst.name: inst}
+    build_threads = []
+    exec_threads = []
+    real_build = app._build_compose_spec
+
+    def tracking_build():
+        build_threads.append(threading.current_thread())
+        return real_build()
+
+    def fake_exec(args):
+        exec_threads.append(threading.current_thread())
+        return True, " ".join(args)
+
+    monkeypatch.setattr(app, "_build_compose_spec", tracking_build)
+    monkeypatch.setattr(app, "_exec_compose", fake_exec)
+    ok, detail = asyncio.run(app._run_compose_async(inst, "rm", include_volumes=True))
+    assert ok and detail == f"rm -s -f -v {inst.service_name}"
+    assert build_threads == [threading.main_thread()]
+    assert exec_threads and exec_threads[0] is not threading.main_thread()
+    assert app.compose_path.exists()
@@ -1,4 +1,5 @@
 import json
+from dataclasses import fields
 
 from agentbox_manager.models import AgentInstance, InstanceStatus
 
@@ -41,3 +42,13 @@ def test_from_dict_legacy_vnc_field():
     }
     inst = AgentInstance.from_dict(payload)
     assert inst.rdp_port == 5901
+
+
+def test_to_dict_covers_all_fields():
+    inst = AgentInstance(name="x", workspace_folder="/tmp/x")
+    assert set(inst.to_dict()) == {f.name for f in fields(AgentInstance)}
+
+
+def test_instance_uses_slots():
+    inst = AgentInstance(name="x", workspace_folder="/tmp/x")
+    assert not hasattr(inst, "__dict__")
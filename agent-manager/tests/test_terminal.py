@@ -0,0 +1,34 @@
+from types import SimpleNamespace
+
+from agentbox_manager import terminal
+
+
+def test_restore_terminal_spawns_only_stty(monkeypatch, capsys):
+    calls = []
+
+    def fake_run(cmd, **kwargs):
+        calls.append(cmd)
+        return SimpleNamespace(returncode=0)
+
+    monkeypatch.setattr("subprocess.run", fake_run)
+    monkeypatch.setattr(terminal, "_LAST_RESTORE", 0.0)
+    terminal.restore_terminal()
+    assert calls == [["stty", "sane"]]
+    assert capsys.readouterr().out == "\x1b[?1049l\x1b[?25h\x1b[?1000l"
+    # an immediate second restore is a no-op
+    terminal.restore_terminal()
+    assert calls == [["stty", "sane"]]
+
+
+def test_attach_command_without_tty_skips_subprocess(monkeypatch):
+    monkeypatch.setattr("sys.stdin", SimpleNamespace(isatty=lambda: False))
+    monkeypatch.setattr(terminal, "restore_terminal", lambda: None)
+    spawned = []
+
+    def fake_run(cmd, **kwargs):
+        raise AssertionError("subprocess.run should be skipped without a TTY")
+
+    monkeypatch.setattr("subprocess.run", fake_run)
+    monkeypatch.setattr("pty.spawn", spawned.append)
+    assert terminal.attach_command(["docker", "exec", "-it", "x"], delay=0)
+    assert spawned == [["docker", "exec", "-it", "x"]]
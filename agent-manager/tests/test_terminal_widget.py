@@ -0,0 +1,228 @@
+import asyncio
+import os
+import threading
+import time
+import tty
+from types import SimpleNamespace
+
+from textual.app import App
+
+from agentbox_manager.screens.terminal_widget import TerminalWidget
+
+
+class TerminalApp(App):
+    def __init__(self, cmd):
+        super().__init__()
+        self.cmd = cmd
+        self.closed = asyncio.Event()
+
+    def compose(self):
+        yield TerminalWidget(cmd=self.cmd, cols=20, rows=4)
+
+    def on_terminal_closed(self, message):
+        self.closed.set()
+
+
+def test_terminal_widget_renders_child_output():
+    app = TerminalApp(["/bin/sh", "-c", "printf 'h\\303\\251llo\\n'; sleep 0.1"])
+
+    async def scenario():
+        async with app.run_test() as pilot:
+            await asyncio.wait_for(app.closed.wait(), timeout=10)
+            await pilot.pause(0.05)
+            widget = app.query_one(TerminalWidget)
+            assert widget.screen_text.splitlines()[0].rstrip() == "héllo"
+            assert widget.master_fd is None
+            assert widget.process_pid is None
+
+    asyncio.run(scenario())
+
+
+def test_key_press_maps_keys_to_pty_bytes(monkeypatch):
+    widget = TerminalWidget()
+    widget.master_fd = 99
+    monkeypatch.setattr(widget, "_try_flush_write", lambda: None)
+    keys = [
+        SimpleNamespace(key="a", character="a"),
+        SimpleNamespace(key="enter", character="\r"),
+        SimpleNamespace(key="up", character=None),
+        SimpleNamespace(key="ctrl+c", character="\x03"),
+        SimpleNamespace(key="exclamation_mark", character="!"),
+        SimpleNamespace(key="eacute", character="é"),
+        SimpleNamespace(key="shift+tab", character=None),
+        SimpleNamespace(key="f5", character=None),
+        # unmapped keys without a character must not reach the shell as text
+        SimpleNamespace(key="ctrl+left", character=None),
+        SimpleNamespace(key="shift+up", character=None),
+    ]
+    for key in keys:
+        asyncio.run(widget.key_press(key))
+    assert bytes(widget._wbuf) == (
+        b"a\r\x1b[A\x03!" + "é".encode("utf-8") + b"\x1b[Z\x1b[15~"
+    )
+
+
+def test_render_row_matches_pyte_display():
+    widget = TerminalWidget(cols=12, rows=3)
+    widget.stream.feed("plain\r\n日本語 wide\r\n\x1b[3;4Hcafé".encode("utf-8"))
+    display = widget.py_screen.display
+    assert [widget._render_row(y) for y in range(3)] == display
+
+
+def test_truncated_utf8_is_flushed_on_eof():
+    app = TerminalApp(["/bin/sh", "-c", "printf 'ok\\303'; sleep 0.1"])
+
+    async def scenario():
+        async with app.run_test() as pilot:
+            await asyncio.wait_for(app.closed.wait(), timeout=10)
+            await pilot.pause(0.05)
+            widget = app.query_one(TerminalWidget)
+            assert widget.screen_text.splitlines()[0].rstrip() == "ok�"
+
+    asyncio.run(scenario())
+
+
+def test_output_is_not_parsed_as_markup():
+    app = TerminalApp(["/bin/sh", "-c", "printf '[bold]x[/bold]\\n'; sleep 0.1"])
+
+    async def scenario():
+        async with app.run_test() as pilot:
+            await asyncio.wait_for(app.closed.wait(), timeout=10)
+            await pilot.pause(0.05)
+            widget = app.query_one(TerminalWidget)
+            assert widget.render().plain.splitlines()[0].rstrip() == (
+                "[bold]x[/bold]"
+            )
+
+    asyncio.run(scenario())
+
+
+def test_child_ignoring_hangup_is_killed_after_grace():
+    app = TerminalApp(["/bin/sh", "-c", "trap '' TERM HUP; echo ready; sleep 30"])
+
+    async def scenario():
+        async with app.run_test() as pilot:
+            widget = app.query_one(TerminalWidget)
+            widget.REAP_GRACE = 0.2
+            pid = widget.process_pid
+            for _ in range(250):
+                if widget.screen_text.startswith("ready"):
+                    break
+                await pilot.pause(0.02)
+            widget.remove()
+            await pilot.pause()
+            assert widget.process_pid is None
+            start = time.monotonic()
+            await asyncio.wait_for(widget._reaper, timeout=5)
+            assert time.monotonic() - start < 3
+        try:
+            os.waitpid(pid, os.WNOHANG)
+        except ChildProcessError:
+            pass
+        else:
+            raise AssertionError("child was not reaped")
+
+    asyncio.run(scenario())
+
+
+def test_feed_finishing_after_unmount_schedules_nothing(monkeypatch):
+    widget = TerminalWidget()
+    started = threading.Event()
+
+    def slow_feed(data, final):
+        started.set()
+        time.sleep(0.1)
+        return {}
+
+    monkeypatch.setattr(widget, "_feed_and_render", slow_feed)
+
+    async def scenario():
+        errors = []
+        loop = asyncio.get_running_loop()
+        loop.set_exception_handler(lambda loop, context: errors.append(context))
+        widget._pending += b"x"
+        widget._maybe_feed()
+        future = widget._feed_future
+        await asyncio.to_thread(started.wait)
+        # EOF lands while the batch is still being parsed, then the widget goes
+        widget._close_pending = True
+        widget.on_unmount()
+        await future
+        await asyncio.sleep(0)
+        assert errors == []
+        assert widget._feed_future is None
+
+    asyncio.run(scenario())
+
+
+def test_write_buffer_survives_full_pty():
+    master, slave = os.openpty()
+    tty.setraw(slave)  # no echo or line editing: the slave sees raw bytes
+    os.set_blocking(master, False)
+    payload = bytes(range(256)) * 1500  # far more than the PTY buffer holds
+    widget = TerminalWidget()
+    widget.master_fd = master
+    received = bytearray()
+
+    def drain():
+        while len(received) < len(payload):
+            received.extend(os.read(slave, 65536))
+
+    async def scenario():
+        widget._wbuf += payload
+        widget._try_flush_write()
+        # the PTY filled up, so the rest waits for the fd to become writable
+        assert widget._writer_registered
+        await asyncio.wait_for(asyncio.to_thread(drain), timeout=10)
+        for _ in range(100):
+            if not widget._writer_registered:
+                break
+            await asyncio.sleep(0.01)
+        assert not widget._writer_registered
+        assert not widget._wbuf
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        widget.master_fd = None
+        os.close(master)
+        os.close(slave)
+    assert bytes(received) == payload
+
+
+def test_endless_output_does_not_starve_the_loop():
+    app = TerminalApp(["yes"])
+
+    async def scenario():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        async with app.run_test() as pilot:
+            task = asyncio.create_task(ticker())
+            await pilot.pause(0.5)
+            task.cancel()
+            assert ticks >= 10
+            assert app.query_one(TerminalWidget).screen_text.startswith("y")
+
+    asyncio.run(scenario())
+
+
+def test_pending_output_stays_bounded_under_endless_output():
+    app = TerminalApp(["yes"])
+
+    async def scenario():
+        async with app.run_test() as pilot:
+            widget = app.query_one(TerminalWidget)
+            limit = widget.PENDING_HIGH_WATER + widget.READ_BUDGET * widget.READ_SIZE
+            peak = 0
+            for _ in range(100):
+                peak = max(peak, len(widget._pending))
+                await pilot.pause(0.01)
+            assert peak <= limit
+
+    asyncio.run(scenario())